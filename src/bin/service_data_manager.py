@@ -221,11 +221,14 @@ def main() -> None:
 
     app.add_url_rule("/api/schedules", "get_schedules", get_schedule_status, methods=["GET"])
 
-    uploader.run(
-        debug=data_manager_cfg["flask_debug_mode"],
-        port=data_manager_cfg["port"],
-        host=data_manager_cfg["host"],
-    )
+    try:
+        uploader.run(
+            debug=data_manager_cfg["flask_debug_mode"],
+            port=data_manager_cfg["port"],
+            host=data_manager_cfg["host"],
+        )
+    finally:
+        data_manager.close()
 
 
 if __name__ == "__main__":
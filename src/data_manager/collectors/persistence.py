@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Dict, TYPE_CHECKING, Union
+from typing import Any, Dict, List, Sequence, TYPE_CHECKING, Tuple, Union
 
 from src.data_manager.collectors.utils.catalog_postgres import PostgresCatalogService
 from src.utils.logging import get_logger
@@ -27,6 +27,44 @@ class PersistenceService:
         updating the catalog with the unique hash of the file and its metadata.
         """
         target_dir.mkdir(parents=True, exist_ok=True)
+        file_path, resource_hash, relative_path, metadata_dict = self._write_resource(resource, target_dir, overwrite)
+        self.catalog.upsert_resource(resource_hash, relative_path, metadata_dict)
+
+        return file_path
+
+    def persist_resources_batch(
+        self,
+        resources: Sequence["BaseResource"],
+        target_dir: Path,
+        overwrite: Union[bool, Sequence[bool]] = False,
+    ) -> List[Path]:
+        """
+        Write several resources to disk and record them in the catalog in one transaction.
+        ``overwrite`` is either one flag for the whole batch or one flag per resource.
+        """
+        if not resources:
+            return []
+        flags = [overwrite] * len(resources) if isinstance(overwrite, bool) else list(overwrite)
+        if len(flags) != len(resources):
+            raise ValueError("overwrite flags must match the number of resources")
+
+        target_dir.mkdir(parents=True, exist_ok=True)
+        file_paths: List[Path] = []
+        entries = []
+        for resource, overwrite_resource in zip(resources, flags):
+            file_path, resource_hash, relative_path, metadata_dict = self._write_resource(
+                resource, target_dir, overwrite_resource
+            )
+            file_paths.append(file_path)
+            entries.append((resource_hash, relative_path, metadata_dict))
+        self.catalog.upsert_resources(entries)
+
+        return file_paths
+
+    def _write_resource(
+        self, resource: "BaseResource", target_dir: Path, overwrite: bool
+    ) -> Tuple[Path, str, str, Dict[str, str]]:
+        """Write the resource file if needed and build its catalog entry."""
         file_path = resource.get_file_path(target_dir)
         
         # Check if file already exists
@@ -35,7 +73,8 @@ class PersistenceService:
         if file_existed and not overwrite:
             logger.debug("Skipping existing resource %s -> %s", resource.get_hash(), file_path)
         else:
-            file_path.parent.mkdir(parents=True, exist_ok=True)
+            if file_path.parent != target_dir:
+                file_path.parent.mkdir(parents=True, exist_ok=True)
             content = resource.get_content()
             self._write_content(file_path, content)
 
@@ -62,9 +101,7 @@ class PersistenceService:
 
         resource_hash = resource.get_hash()
         logger.debug(f"Stored resource {resource_hash} -> {file_path}")
-        self.catalog.upsert_resource(resource_hash, relative_path, metadata_dict)
-
-        return file_path
+        return file_path, resource_hash, relative_path, metadata_dict
     
     def delete_resource(self, resource_hash:str, flush: bool = True) -> Path:
         """
@@ -155,10 +192,10 @@ class PersistenceService:
             raise ValueError("Resource provided no content to persist")
 
         if isinstance(content, (bytes, bytearray)):
-            payload = bytes(content)
-            if not payload:
+            if not content:
                 raise ValueError("Refusing to persist empty binary content")
-            file_path.write_bytes(payload)
+            # write_bytes takes any buffer, so bytearray payloads are written without a copy
+            file_path.write_bytes(content)
             return
 
         if isinstance(content, str):
@@ -14,6 +14,10 @@ from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+_REPO_NAME_RE = re.compile(r"(?:github|gitlab)\.[\w.]+\/[^\/]+\/([\w.-]+)(?:\.git|\/|$)", re.IGNORECASE)
+_TREE_SPLIT_RE = re.compile(r"/(?:-/)?tree/")
+_URL_CREDENTIALS_RE = re.compile(r"//[^@/]+@")
+
 if TYPE_CHECKING:
     from src.data_manager.collectors.scrapers.scraper_manager import \
         ScraperManager
@@ -244,8 +248,7 @@ class GitScraper:
     def _parse_url(self, url: str) -> dict:
         branch_name = None
 
-        regex_repo_name = r"(?:github|gitlab)\.[\w.]+\/[^\/]+\/([\w.-]+)(?:\.git|\/|$)"
-        match = re.search(regex_repo_name, url, re.IGNORECASE)
+        match = _REPO_NAME_RE.search(url)
         if not match:
             raise ValueError(f"The git url {url} does not match the expected format.")
 
@@ -264,7 +267,7 @@ class GitScraper:
             # No credentials - use URL as-is (for public repos)
             clone_from_url = url
 
-        branch_split = re.split(r"/(?:-/)?tree/", clone_from_url, maxsplit=1)
+        branch_split = _TREE_SPLIT_RE.split(clone_from_url, maxsplit=1)
         if len(branch_split) > 1:
             branch_name = branch_split[1].strip("/") or None
             clone_from_url = branch_split[0].rstrip("/")
@@ -307,8 +310,8 @@ class GitScraper:
             return None
 
     def _compute_web_base_url(self, original_url: str) -> str:
-        sanitized = re.sub(r"//[^@/]+@", "//", original_url)
-        sanitized = re.split(r"/(?:-/)?tree/", sanitized, maxsplit=1)[0]
+        sanitized = _URL_CREDENTIALS_RE.sub("//", original_url)
+        sanitized = _TREE_SPLIT_RE.split(sanitized, maxsplit=1)[0]
         if sanitized.endswith(".git"):
             sanitized = sanitized[:-4]
         return sanitized.rstrip("/")
@@ -17,11 +17,15 @@ from selenium.common.exceptions import TimeoutException
 
 from src.data_manager.collectors.scrapers.scraped_resource import \
     ScrapedResource, BrowserIntermediaryResult
+from src.data_manager.collectors.scrapers.scraper import IMAGE_EXTENSIONS
 from src.utils.env import read_secret
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# TWiki action endpoints (diffs, edit forms, PDFs, ...) that never hold page content.
+_SKIPPED_TWIKI_PATHS = re.compile(r"bin/(?:rdiff|edit|oops|attach|genpdf)|/WebIndex")
+
 class SSOScraper(ABC):
     """Generic base class for SSO-authenticated web scrapers."""
     
@@ -49,10 +53,7 @@ class SSOScraper(ABC):
     
     def _is_image_url(self, url: str) -> bool:
         """Check if URL points to an image file."""
-        image_extensions = ('.png', '.jpg', '.jpeg', '.gif', '.bmp', '.svg', '.ico', '.webp')
-        parsed_url = urllib.parse.urlparse(url)
-        path = parsed_url.path.lower()
-        return any(path.endswith(ext) for ext in image_extensions)
+        return urllib.parse.urlparse(url).path.lower().endswith(IMAGE_EXTENSIONS)
     
     @abstractmethod
     def get_username_from_env(self):
@@ -134,7 +135,7 @@ class SSOScraper(ABC):
 
                         # this works for CMS twiki but should be generalized
                         normalized_url = normalized_url.split("?")[0]
-                        if 'bin/rdiff' in normalized_url or 'bin/edit' in normalized_url or 'bin/oops' in normalized_url  or 'bin/attach' in normalized_url or 'bin/genpdf' in normalized_url or '/WebIndex' in normalized_url:
+                        if _SKIPPED_TWIKI_PATHS.search(normalized_url):
                             continue
                         
                         if not self._clear_url(normalized_url):
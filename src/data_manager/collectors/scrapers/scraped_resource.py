@@ -31,6 +31,11 @@ class ScrapedResource(BaseResource):
         identifier.update(self.url.encode("utf-8"))
         return str(int(identifier.hexdigest(), 16))[:12]
 
+    def get_content_hash(self) -> str:
+        """Fingerprint of the payload, used to tell whether a re-scraped page actually changed."""
+        payload = self.content.encode("utf-8") if isinstance(self.content, str) else (self.content or b"")
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
     def get_filename(self) -> str:
         if self.file_name:
             return self.file_name
@@ -51,6 +56,7 @@ class ScrapedResource(BaseResource):
         extra.setdefault("url", self.url)
         extra.setdefault("suffix", self.suffix)
         extra.setdefault("source_type", self.source_type)
+        extra.setdefault("content_hash", self.get_content_hash())
         display_name = extra.get("display_name")
         if display_name is None:
             display_name = self._format_link_display(self.url)
@@ -1,11 +1,27 @@
+import io
 import random
 import re
+import threading
 import time
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 
 import requests
-from typing import Dict, Iterator, List, Optional
+from requests.adapters import HTTPAdapter
+from requests.compat import chardet
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
 from bs4 import BeautifulSoup
-from urllib.parse import urlparse, urljoin, urldefrag, urlunparse
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
+from urllib.parse import ParseResult, urlparse, urljoin, urldefrag, urlunparse
+from urllib3.util.retry import Retry
 
 from src.data_manager.collectors.scrapers.scraped_resource import \
     ScrapedResource
@@ -23,6 +39,143 @@ DEFAULT_HTTP_HEADERS = {
     "Accept-Language": "en-US,en;q=0.9",
 }
 
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.bmp', '.svg', '.ico', '.webp')
+
+# Seconds to wait for a page before giving up on it.
+REQUEST_TIMEOUT = 30
+
+# Responses worth downloading; anything else (archives, images, binaries) is dropped after the headers.
+# URLs ending in .pdf are kept whatever their content type, servers often label them application/octet-stream.
+ACCEPTED_CONTENT_TYPES = ("text/", "application/xhtml+xml", "application/xml", "application/pdf")
+MAX_RESPONSE_BYTES = 50 * 1024 * 1024
+# Bodies are read in chunks of this size so MAX_RESPONSE_BYTES holds without a Content-Length header.
+READ_CHUNK_BYTES = 64 * 1024
+
+# Retry transient server errors with a short backoff instead of dropping the page.
+RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 504)
+# response header -> resource metadata key, used for conditional requests on incremental syncs
+VALIDATOR_HEADERS = (("ETag", "etag"), ("Last-Modified", "last_modified"))
+
+
+@lru_cache(maxsize=8192)
+def _parse(url: str) -> ParseResult:
+    """Memoized urlparse; the same URL is parsed several times while it moves through a crawl."""
+    return urlparse(url)
+
+
+# numbered/named backreferences and conditional groups depend on group numbering, which an alternation shifts
+_GROUP_REFERENCE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+
+
+def _compile_union(patterns: List["re.Pattern"]) -> Optional["re.Pattern"]:
+    """
+    Fold compiled patterns into one alternation so a path is scanned once instead of once per pattern.
+    Returns None when the patterns cannot be combined (e.g. inline global or mixed flags, backreferences),
+    callers then test them one by one.
+    """
+    if not patterns:
+        return None
+    flags = {rx.flags for rx in patterns}
+    if len(flags) != 1:
+        return None
+    if any(_GROUP_REFERENCE.search(rx.pattern) for rx in patterns):
+        return None
+    try:
+        return re.compile("|".join(f"(?:{rx.pattern})" for rx in patterns), flags.pop())
+    except re.error:
+        return None
+
+
+class HostRateLimiter:
+    """
+    Per-host politeness limiter. Each acquire() reserves the next start slot for the host,
+    `delay` +/- `jitter` seconds after the previous one, so concurrent workers stay spaced out
+    while different hosts proceed independently. Time spent parsing counts towards the delay.
+    """
+
+    def __init__(self, delay: float = 0.5, jitter: float = 0.0) -> None:
+        self.delay = delay
+        self.jitter = max(0.0, jitter)
+        self._next = defaultdict(float)
+        self._lock = threading.Lock()
+
+    def acquire(self, host: str) -> None:
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next[host])
+            gap = max(0.0, self.delay + random.uniform(-self.jitter, self.jitter))
+            self._next[host] = start + gap
+        if start > now:
+            time.sleep(start - now)
+
+
+def build_session(headers: Optional[Dict[str, str]] = None) -> requests.Session:
+    """Create a keep-alive session with a sized connection pool and retries."""
+    session = requests.Session()
+    retries = Retry(total=3, backoff_factor=0.3, status_forcelist=RETRYABLE_STATUS_CODES)
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=retries)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update(DEFAULT_HTTP_HEADERS if headers is None else headers)
+    return session
+
+
+def _decode_body(response: requests.Response, body: bytearray) -> str:
+    """Decode a page body the way Response.text does, from the bytes _fetch already read."""
+    encoding = response.encoding
+    if encoding is None and chardet is not None:
+        encoding = chardet.detect(body)["encoding"]
+    try:
+        return str(body, encoding or "utf-8", errors="replace")
+    except (LookupError, TypeError):
+        return str(body, errors="replace")
+
+
+def _iter_hrefs_lxml(content) -> Iterator[str]:
+    """Stream anchors through libxml2, dropping every subtree once parsed so memory stays flat on large pages."""
+    if isinstance(content, str):
+        source, encoding = content.encode("utf-8"), "utf-8"
+    else:
+        source, encoding = content, None
+    if not source:
+        return
+    parser = etree.iterparse(io.BytesIO(source), events=("end",), html=True, recover=True, encoding=encoding)
+    try:
+        for _, element in parser:
+            if element.tag == "a":
+                href = element.get("href")
+                if href is not None:
+                    yield href
+            # the parser keeps finished elements attached to the tree, so drop them and their earlier siblings
+            element.clear()
+            parent = element.getparent()
+            if parent is not None:
+                while element.getprevious() is not None:
+                    del parent[0]
+    except etree.XMLSyntaxError:
+        # raised for documents without any element (e.g. plain text bodies)
+        return
+
+
+def _extract_hrefs(content) -> Iterator[str]:
+    """
+    Yield the href of every anchor in an HTML page.
+    Prefers the lexbor parser, then streaming lxml, and falls back to BeautifulSoup.
+    """
+    if LexborHTMLParser is not None:
+        tree = LexborHTMLParser(content)
+        for node in tree.css("a[href]"):
+            href = node.attributes.get("href")
+            if href is not None:
+                yield href
+        return
+    if etree is not None:
+        yield from _iter_hrefs_lxml(content)
+        return
+    soup = BeautifulSoup(content, "html.parser")
+    for tag in soup.find_all("a", href=True):
+        yield tag["href"]
+
 class LinkScraper:
     """
     Single scraper for all our link needs that handles Selenium and requests.
@@ -36,30 +189,69 @@ class LinkScraper:
         self,
         verify_urls: bool = True,
         enable_warnings: bool = True,
-        allowed_path_regexes: List[str] = [],
-        denied_path_regexes: List[str] = [],
+        allowed_path_regexes: Optional[List[Union[str, "re.Pattern"]]] = None,
+        denied_path_regexes: Optional[List[Union[str, "re.Pattern"]]] = None,
         delay: float = 0.5,
         delay_jitter: float = 0.3,
+        max_workers: int = 4,
+        rate_limiter: Optional[HostRateLimiter] = None,
+        session: Optional[requests.Session] = None,
     ) -> None:
         self.verify_urls = verify_urls
         self.enable_warnings = enable_warnings
         # seen_urls tracks anything queued/visited; visited_urls tracks pages actually crawled.
         self.visited_urls = set()
         self.seen_urls = set()
-        self._allowed = [re.compile(rx) for rx in allowed_path_regexes]
-        self._denied = [re.compile(rx) for rx in denied_path_regexes]
+        # re.compile hands already-compiled patterns back unchanged
+        self._allowed = [re.compile(rx) for rx in allowed_path_regexes or ()]
+        self._denied = [re.compile(rx) for rx in denied_path_regexes or ()]
+        self._allowed_re = _compile_union(self._allowed)
+        self._denied_re = _compile_union(self._denied)
         self.delay = delay
         self.delay_jitter = max(0.0, delay_jitter)
+        self.max_workers = max(1, max_workers)
+        # pass a shared limiter to keep several scrapers polite towards the same host
+        self.rate_limiter = rate_limiter or HostRateLimiter(delay, self.delay_jitter)
         self._headers = dict(DEFAULT_HTTP_HEADERS)
-    
+        # a session handed in by the caller is shared with other scrapers and left open on close()
+        self._session: Optional[requests.Session] = session
+        self._owns_session = session is None
+
+    @property
+    def session(self) -> requests.Session:
+        """HTTP session reused across crawls so connections stay alive between pages."""
+        if self._session is None:
+            self._session = build_session(self._headers)
+        return self._session
+
+    def close(self) -> None:
+        if self._session is not None and self._owns_session:
+            self._session.close()
+            self._session = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
     def _is_image_url(self, url: str) -> bool:
         """Check if URL points to an image file."""
-        image_extensions = ('.png', '.jpg', '.jpeg', '.gif', '.bmp', '.svg', '.ico', '.webp')
-        parsed_url = urlparse(url)
-        path = parsed_url.path.lower()
-        return any(path.endswith(ext) for ext in image_extensions)
+        return _parse(url).path.lower().endswith(IMAGE_EXTENSIONS)
 
-    def reap(self, response, current_url: str, selenium_scrape: bool = False, authenticator = None):
+    @staticmethod
+    def _is_pdf_url(url: str) -> bool:
+        """Check if URL points to a PDF, which reap stores as bytes rather than text."""
+        return url.lower().endswith(".pdf")
+
+    def reap(
+        self,
+        response,
+        current_url: str,
+        selenium_scrape: bool = False,
+        authenticator = None,
+        body: Optional[bytearray] = None,
+    ):
         """
         probably the most complicated method here and most volatile in terms of maybe later needing a rewrite
 
@@ -71,6 +263,7 @@ class LinkScraper:
             response (BrowserIntermediaryResult | requests.response): whatever has been collected for the current_url by the scraper
             selenium_scrape (bool): whether or not selenium was used to scrape this content
             authenticator (SSOAuthenticator | None): client being used to crawl websites or just for auth 
+            body (bytearray | None): page body already read by _fetch; read from the response when omitted
 
         Return (tuple[list[str], list[ScrapedResource]]): next links to crawl and resources collected
         """
@@ -102,16 +295,17 @@ class LinkScraper:
                     "renderer": "selenium",
                 },
             )
-            res = authenticator.get_links_with_same_hostname(current_url)
+            # the browser returns raw hrefs; normalize them here so every link leaving reap is normalized
+            res = [link for link in map(self._normalize_url, authenticator.get_links_with_same_hostname(current_url)) if link]
             resources.append(resource)
                 
         else: # deals with http response
             content_type = response.headers.get("Content-type")
 
-            if current_url.lower().endswith(".pdf"):
+            if self._is_pdf_url(current_url):
                 resource = ScrapedResource(
                     url=current_url,
-                    content=response.content,
+                    content=response.content if body is None else body,
                     suffix="pdf",
                     source_type=source_type,
                     metadata={"content_type": content_type},
@@ -119,7 +313,7 @@ class LinkScraper:
             else:
                 resource = ScrapedResource(
                     url=current_url,
-                    content=response.text,
+                    content=response.text if body is None else _decode_body(response, body),
                     suffix="html",
                     source_type=source_type,
                     metadata={
@@ -127,6 +321,10 @@ class LinkScraper:
                         "encoding": response.encoding,
                     },
                 )
+            # cache validators let the next incremental sync ask the server whether the page changed
+            for header, key in VALIDATOR_HEADERS:
+                if response.headers.get(header):
+                    resource.metadata[key] = response.headers[header]
             res = self.get_links_with_same_hostname(current_url, resource)
             resources.append(resource)
 
@@ -174,6 +372,8 @@ class LinkScraper:
         selenium_scrape: bool = False,
         max_pages: Optional[int] = None,
         collect_page_data: bool = False,
+        validators: Optional[Dict[str, Dict[str, str]]] = None,
+        claim_page: Optional[Callable[[], bool]] = None,
     ) -> Iterator[ScrapedResource]:
         """
         crawl pages from a given starting url up to a given depth either using basic http or a provided browser client
@@ -185,6 +385,10 @@ class LinkScraper:
             selenium_scrape (bool): tracks whether or not the page should be scraped through selenium or not
             max_pages (int | None): cap on total pages to visit before stopping
             collect_page_data (bool): whether to store resources on the scraper instance
+            validators (dict | None): etag/last_modified per url from a previous sync; pages the server
+                reports as unchanged (304) are skipped and not expanded
+            claim_page (callable | None): called for every fetched page, like the max_pages count;
+                returning False stops the crawl. Lets several crawls share one page budget
 
         Returns: Iterator[ScrapedResource]
 
@@ -202,16 +406,18 @@ class LinkScraper:
         if not normalized_start_url:
             logger.error(f"Failed to crawl: {start_url}, could not normalize URL")
             return
-        to_visit = [normalized_start_url]
+        to_visit = deque([normalized_start_url])
         self.seen_urls.add(normalized_start_url)
-        level_links = []
+        level_links = deque()
         pages_visited = 0
+        budget_spent = False
 
-        base_hostname = urlparse(normalized_start_url).netloc
+        base_hostname = _parse(normalized_start_url).netloc
         logger.info(f"Base hostname for crawling: {base_hostname}")
 
         # session either stays none or becomes a requests.Session object if not selenium scraping
         session = None
+        auth_session = None
 
         if selenium_scrape: # scrape page with pure selenium
             if browserclient is None: 
@@ -220,9 +426,9 @@ class LinkScraper:
             browserclient.authenticate_and_navigate(normalized_start_url)
 
         elif not selenium_scrape and browserclient is not None: # use browser client for auth but scrape with http request
-            session = requests.Session()
-            session.headers.update(self._headers)
             cookies = browserclient.authenticate(normalized_start_url)
+            # SSO cookies get a session of their own; self.session may be shared with unauthenticated crawls
+            session = auth_session = build_session(self._headers)
             if cookies is not None:
                 for cookie_args in cookies:
                     cookie = requests.cookies.create_cookie(name=cookie_args['name'],
@@ -234,89 +440,175 @@ class LinkScraper:
                     session.cookies.set_cookie(cookie)
 
         else: # pure html no browser client needed
-            session = requests.Session()
-            session.headers.update(self._headers)
-
-        while to_visit and depth < max_depth:
-            if max_pages is not None and pages_visited >= max_pages:
-                logger.info(f"Reached max_pages={max_pages}; stopping crawl early.")
-                break
-            current_url = to_visit.pop(0)
-            
-            # Skip if we've already visited this URL
-            if current_url in self.visited_urls:
-                continue
-            
-            # Skip image files
-            if self._is_image_url(current_url):
-                logger.debug(f"Skipping image URL: {current_url}")
-                self._mark_visited(current_url)
-                continue
-
-            logger.info(f"Crawling depth {depth + 1}/{max_depth}: {current_url}")
+            session = self.session
+
+        # selenium drives a single browser, so only plain http fetches run concurrently
+        batch_size = 1 if selenium_scrape else self.max_workers
+
+        try:
+            with ThreadPoolExecutor(max_workers=batch_size) as executor:
+                while to_visit and depth < max_depth and not budget_spent:
+                    if max_pages is not None and pages_visited >= max_pages:
+                        logger.info(f"Reached max_pages={max_pages}; stopping crawl early.")
+                        break
+
+                    budget = batch_size if max_pages is None else min(batch_size, max_pages - pages_visited)
+                    batch = []
+                    while to_visit and len(batch) < budget:
+                        current_url = to_visit.popleft()
+
+                        # Skip if we've already visited this URL
+                        if current_url in self.visited_urls:
+                            continue
+
+                        # Skip image files
+                        if self._is_image_url(current_url):
+                            logger.debug(f"Skipping image URL: {current_url}")
+                            self._mark_visited(current_url)
+                            continue
+
+                        logger.info(f"Crawling depth {depth + 1}/{max_depth}: {current_url}")
+                        batch.append(current_url)
+
+                    if selenium_scrape:
+                        futures = {}
+                    else:
+                        assert (session is not None) # REMOVELATER
+                        futures = {
+                            executor.submit(self._fetch, session, url, (validators or {}).get(url)): url
+                            for url in batch
+                        }
+
+                    for current_url, future in self._iter_batch_results(batch, futures):
+                        try:
+                            # grab the page content
+                            body = None
+                            if not selenium_scrape:
+                                fetched = future.result()
+                                if fetched is None:
+                                    self._mark_visited(current_url)
+                                    continue
+                                response, body = fetched
+                            else:
+                                assert (browserclient is not None) # REMOVELATER
+                                self.rate_limiter.acquire(_parse(current_url).netloc)
+                                browserclient.navigate_to(current_url, wait_time = 2)
+                                response = browserclient.extract_page_data(current_url) # see the BrowserIntermediaryResult class to see what comes back here
+
+                            if claim_page is not None and not claim_page():
+                                logger.info("Shared page budget is spent; stopping crawl early.")
+                                budget_spent = True
+                                break
+
+                            # Mark as visited and store content
+                            pages_visited += 1
+                            new_links, resources = self.reap(response, current_url, selenium_scrape, browserclient, body=body)
+                            current_path = _parse(current_url).path or "/"
+                            for resource in resources:
+                                if self._is_allowed_path(current_path):
+                                    if collect_page_data:
+                                        self.page_data.append(resource)
+                                    yield resource
+
+                            # links from reap are already normalized, so they can be checked against seen_urls as-is
+                            for link in new_links:
+                                if link in self.seen_urls:
+                                    continue
+                                logger.info(f"Found new link: {link} (nv: {pages_visited})")
+                                self.seen_urls.add(link)
+                                level_links.append(link)
+
+                        except Exception as e:
+                            logger.info(f"Error crawling {current_url}: {e}")
+                            self._mark_visited(current_url)  # Mark as visited to avoid retrying
+
+                    if not to_visit:
+                        to_visit.extend(level_links)
+                        level_links.clear()
+                        depth += 1
+        finally:
+            if auth_session is not None:
+                auth_session.close()
 
-            try:
-                sleep_time = max(
-                    0.0,
-                    self.delay + random.uniform(-self.delay_jitter, self.delay_jitter),
-                )
-                time.sleep(sleep_time)
-
-                # grab the page content 
-                if not selenium_scrape: 
-                    assert (session is not None) # REMOVELATER
-                    response = session.get(current_url, verify = self.verify_urls)
-                    response.raise_for_status()
-                else: 
-                    assert (browserclient is not None) # REMOVELATER
-                    browserclient.navigate_to(current_url, wait_time = 2)
-                    response = browserclient.extract_page_data(current_url) # see the BrowserIntermediaryResult class to see what comes back here
-                            
-                
-                # Mark as visited and store content
-                pages_visited += 1
-                new_links, resources = self.reap(response, current_url, selenium_scrape, browserclient)
-                current_path = urlparse(current_url).path or "/"
-                for resource in resources:
-                    if self._is_allowed_path(current_path):
-                        if collect_page_data:
-                            self.page_data.append(resource)
-                        yield resource
-                        
-                for link in new_links:
-                    normalized_link = self._normalize_url(link)
-                    if not normalized_link:
-                        continue
-                    if normalized_link in self.seen_urls:
-                        continue
-                    logger.info(f"Found new link: {normalized_link} (nv: {pages_visited})")
-                    self.seen_urls.add(normalized_link)
-                    level_links.append(normalized_link)
-
-            except Exception as e:
-                logger.info(f"Error crawling {current_url}: {e}")
-                self._mark_visited(current_url)  # Mark as visited to avoid retrying           
-
-            if not to_visit:
-                to_visit.extend(level_links)
-                level_links = []
-                depth += 1
-            
         logger.info(f"Crawling complete. Visited {pages_visited} pages.")
         return
 
+    def _fetch(
+        self,
+        session: requests.Session,
+        url: str,
+        validator: Optional[Dict[str, str]] = None,
+    ) -> Optional[Tuple[requests.Response, bytearray]]:
+        """
+        Fetch a page and its body, returning None when its headers show it is unchanged or not worth downloading.
+        The body is returned separately; the response's own content is left unread.
+        """
+        headers = {}
+        if validator:
+            if validator.get("etag"):
+                headers["If-None-Match"] = validator["etag"]
+            if validator.get("last_modified"):
+                headers["If-Modified-Since"] = validator["last_modified"]
+        self.rate_limiter.acquire(_parse(url).netloc)
+        with session.get(
+            url, headers=headers or None, verify=self.verify_urls, timeout=REQUEST_TIMEOUT, stream=True
+        ) as response:
+            if response.status_code == 304:
+                logger.info(f"Skipping {url}: not modified since the last sync")
+                return None
+            response.raise_for_status()
+            if not self._accepts_response(url, response):
+                return None
+            # read the body on the worker thread so the crawl loop never waits on the socket,
+            # giving up as soon as it grows past the cap
+            body = bytearray()
+            for chunk in response.iter_content(chunk_size=READ_CHUNK_BYTES):
+                body.extend(chunk)
+                if len(body) > MAX_RESPONSE_BYTES:
+                    logger.info(f"Skipping {url}: body exceeds {MAX_RESPONSE_BYTES} bytes")
+                    return None
+        return response, body
+
+    def _accepts_response(self, url: str, response: requests.Response) -> bool:
+        content_type = (response.headers.get("Content-Type") or "").lower()
+        if content_type and not content_type.startswith(ACCEPTED_CONTENT_TYPES) and not self._is_pdf_url(url):
+            logger.info(f"Skipping {url}: unsupported content type {content_type}")
+            return False
+        content_length = response.headers.get("Content-Length", "")
+        if content_length.isdigit() and int(content_length) > MAX_RESPONSE_BYTES:
+            logger.info(f"Skipping {url}: body of {content_length} bytes exceeds {MAX_RESPONSE_BYTES}")
+            return False
+        return True
+
+    @staticmethod
+    def _iter_batch_results(batch, futures):
+        """Pair each url with its fetch future as soon as it completes; urls without a future are yielded in order."""
+        if not futures:
+            for url in batch:
+                yield url, None
+            return
+        for future in as_completed(futures):
+            yield futures[future], future
+
     def _normalize_url(self, url: str) -> Optional[str]:
+        parts = self._normalize_parts(url)
+        return parts[0] if parts else None
+
+    def _normalize_parts(self, url: str) -> Optional[Tuple[str, ParseResult]]:
+        """Drop the fragment and lowercase scheme/host, returning the URL with its parsed form so callers need not reparse it."""
         if not url:
             return None
 
-        normalized, _ = urldefrag(url)
-        parsed = urlparse(normalized)
+        parsed = _parse(url)
         if not parsed.scheme:
-            return normalized
-        return parsed._replace(
+            normalized, _ = urldefrag(url)
+            return normalized, _parse(normalized)
+        parsed = parsed._replace(
             scheme=parsed.scheme.lower(),
             netloc=parsed.netloc.lower(),
-        ).geturl()
+            fragment="",
+        )
+        return parsed.geturl(), parsed
 
     def _mark_visited(self, url: str) -> None:
         normalized = self._normalize_url(url)
@@ -327,51 +619,47 @@ class LinkScraper:
     
     def _is_allowed_path(self, path: str) -> bool:
         # Denied regexes take precedence
-        if any(rx.search(path) for rx in self._denied):
+        if self._denied_re is not None:
+            if self._denied_re.search(path):
+                return False
+        elif any(rx.search(path) for rx in self._denied):
             return False
         if not self._allowed: # no allowed regexes, so everything is allowed
             return True
         # Must match at least one allowed regex
+        if self._allowed_re is not None:
+            return self._allowed_re.match(path) is not None
         return any(rx.match(path) for rx in self._allowed)
 
-    def _unique(self, xs: List[str]) -> Iterator[str]: 
-        """Unique items while preserving order. Return a generator instead of a set to avoid unnecessary memory allocation."""
-        seen = set()
-        for x in xs: 
-            if x not in seen:
-                seen.add(x)
-                yield x
-
-    def _canonical_url(self, url: str) -> str:
+    def _canonical_url(self, url: str, parsed: Optional[ParseResult] = None) -> str:
         """
         Return a canonical URL by removing query strings and fragments. Drops specific parameters (e.g. ?rev=, ?version=, ?skin=) and reconstructs the URL using only scheme, host, and path.
+        Pass `parsed` when the caller already holds the parse result of `url`.
         """
-        p = urlparse(url)
+        p = parsed or _parse(url)
         return urlunparse((p.scheme, p.netloc, p.path, "", "", ""))
 
     def get_links_with_same_hostname(self, url: str, page_data: ScrapedResource):
         """Return all links on the page that share the same hostname as `url`. For now does not support PDFs"""
 
         base_url = self._normalize_url(url) or url
-        base_hostname = urlparse(base_url).netloc
-        links = set()
-        a_tags = []
-        
-        if (page_data.suffix == "html"):
-            soup = BeautifulSoup(page_data.content, "html.parser")
-            a_tags = soup.find_all("a", href=True) 
+        base_hostname = _parse(base_url).netloc
+        is_twiki = "twiki" in base_hostname
+        # dict keys double as an insertion-ordered set, so links are deduplicated in the same pass
+        links: Dict[str, None] = {}
+        hrefs = _extract_hrefs(page_data.content) if page_data.suffix == "html" else ()
 
         # how many  links found on the first level
-        for tag in a_tags:
-            full = urljoin(base_url, tag["href"])
-            normalized = self._normalize_url(full)
-            _, link_netloc, link_path, *_ = urlparse(normalized)
-            if not normalized:
+        for href in hrefs:
+            full = urljoin(base_url, href)
+            parts = self._normalize_parts(full)
+            if not parts:
                 continue
-            if link_netloc == base_hostname:
-                if "twiki" in base_hostname and self._is_allowed_path(link_path):
-                        canonicalized_url = self._canonical_url(normalized)
-                        links.add(canonicalized_url)
+            normalized, parsed = parts
+            if parsed.netloc == base_hostname:
+                if is_twiki and self._is_allowed_path(parsed.path):
+                        canonicalized_url = self._canonical_url(normalized, parsed)
+                        links[canonicalized_url] = None
                 else:
-                    links.add(normalized)
-        return list(self._unique(links))
+                    links[normalized] = None
+        return list(links)
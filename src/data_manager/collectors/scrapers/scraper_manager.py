@@ -1,23 +1,120 @@
 import os
 import importlib
+import queue
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 from src.data_manager.collectors.persistence import PersistenceService
 from src.data_manager.collectors.scrapers.scraped_resource import \
     ScrapedResource
-from src.data_manager.collectors.scrapers.scraper import LinkScraper
+from src.data_manager.collectors.scrapers.scraper import (VALIDATOR_HEADERS,
+                                                      HostRateLimiter,
+                                                      LinkScraper,
+                                                      build_session)
 from src.utils.config_access import get_global_config
 from src.utils.env import read_secret
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# weblist entries with these prefixes go to the git and SSO collectors (returned in this order)
+SOURCE_URL_PREFIXES = ("git-", "sso-")
+
+# resources written to disk and committed to the catalog together
+PERSIST_BATCH_SIZE = 32
+
+# pages a crawl may run ahead of persistence
+CRAWL_PREFETCH = 64
+
+# metadata read back from the catalog by scheduled collections
+# stored per resource to tell whether a re-scraped page needs writing: its fingerprint and cache validators
+DELTA_METADATA_KEYS = ["content_hash"] + [key for _, key in VALIDATOR_HEADERS]
+CATALOG_METADATA_KEYS = ["url"] + DELTA_METADATA_KEYS
+
 if TYPE_CHECKING:
     from src.data_manager.collectors.scrapers.integrations.git_scraper import \
         GitScraper
 
 
+def _iter_in_background(items: Iterable, maxsize: int = CRAWL_PREFETCH) -> Iterator:
+    """
+    Drain ``items`` on a worker thread into a bounded queue, so the producer (network) keeps
+    running while the caller works on what it already received (disk/catalog).
+    Errors raised by the producer are re-raised to the caller.
+    """
+    buffer: "queue.Queue" = queue.Queue(maxsize=maxsize)
+    done = object()
+    stop = threading.Event()
+    errors: List[BaseException] = []
+
+    def offer(item) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        iterator = iter(items)
+        try:
+            for item in iterator:
+                if not offer(item):
+                    break
+        except BaseException as exc:
+            errors.append(exc)
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+            offer(done)
+
+    worker = threading.Thread(target=produce, name="crawl-producer", daemon=True)
+    worker.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is done:
+                break
+            yield item
+        if errors:
+            raise errors[0]
+    finally:
+        stop.set()
+        worker.join()
+
+
+@lru_cache(maxsize=None)
+def _resolve_class(class_name: str, module_name: str) -> type:
+    """Import a selenium integration class once per process."""
+    module = importlib.import_module(module_name)
+    return getattr(module, class_name)
+
+
+class _PageBudget:
+    """Pages left for one link collection run, shared by seeds crawled concurrently. Crawls take one per fetched page."""
+
+    def __init__(self, total: int) -> None:
+        self.remaining = total
+        self._lock = threading.Lock()
+
+    @property
+    def exhausted(self) -> bool:
+        return self.remaining <= 0
+
+    def take(self) -> bool:
+        with self._lock:
+            if self.remaining <= 0:
+                return False
+            self.remaining -= 1
+            return True
+
+
 class ScraperManager:
     """Coordinates scraper integrations and centralises persistence logic."""
 
@@ -33,12 +130,17 @@ class ScraperManager:
         self.base_depth = links_config.get('base_source_depth', 5)
         self.allowed_path_regexes = links_config.get('allowed_path_regexes', [])
         self.denied_path_regexes = links_config.get('denied_path_regexes', [])
+        # compiled once here rather than by every LinkScraper the manager creates
+        self._allowed_path_patterns = tuple(re.compile(rx) for rx in self.allowed_path_regexes)
+        self._denied_path_patterns = tuple(re.compile(rx) for rx in self.denied_path_regexes)
         logger.debug(f"Using base depth of {self.base_depth} for weblist URLs")
 
         scraper_config = {}
         if isinstance(links_config, dict):
             scraper_config = links_config.get("html_scraper", {}) or {}
         self.config = scraper_config
+        # skip re-persisting pages whose content hash matches the catalog
+        self.delta_enabled = bool(self.config.get("delta_enabled", True))
         raw_max_pages = links_config.get("max_pages")
         self.max_pages = None
         if raw_max_pages not in (None, ""):
@@ -55,6 +157,9 @@ class ScraperManager:
         self.scrape_with_selenium = self.selenium_config.get("use_for_scraping", False)
 
         self.sso_enabled = bool(sso_config.get("enabled", False))
+        self._sso_defaults_applied = False
+        # scheduled runs send conditional requests and skip pages the server reports unchanged
+        self.incremental_sync_enabled = bool(links_config.get("incremental_sync_enabled", False))
 
         self.data_path = Path(global_config["DATA_PATH"])
         self.input_lists = links_config.get("input_lists", [])
@@ -62,12 +167,14 @@ class ScraperManager:
 
         self.data_path.mkdir(parents=True, exist_ok=True)
 
-        self.web_scraper = LinkScraper(
-            verify_urls=self.config.get("verify_urls", False),  # Default to False for broader compatibility
-            enable_warnings=self.config.get("enable_warnings", False),
-            allowed_path_regexes=self.allowed_path_regexes,
-            denied_path_regexes=self.denied_path_regexes,
-        )
+        # number of seed URLs crawled concurrently; 1 keeps the sequential behaviour
+        self.parallel_seeds = self._read_parallel_seeds()
+        self._persist_lock = threading.Lock()
+        self._dirs_prepared: Set[Path] = set()
+
+        # one pooled keep-alive session shared by every LinkScraper this manager creates
+        self.http_session = build_session()
+        self.web_scraper = self._new_link_scraper()
         self._git_scraper: Optional["GitScraper"] = None
           
     def collect_all_from_config(
@@ -82,8 +189,11 @@ class ScraperManager:
             self.sso_enabled = True
             self._ensure_sso_defaults()
 
-        self.collect_links(persistence, link_urls=link_urls)
-        self.collect_sso(persistence, sso_urls=sso_urls)
+        # a full run touches most of the catalog, so load the stored hashes in one query per source type
+        known_web = self._load_known_resources(persistence, "web") if link_urls else None
+        known_sso = self._load_known_resources(persistence, "sso") if sso_urls else None
+        self.collect_links(persistence, link_urls=link_urls, known_resources=known_web)
+        self.collect_sso(persistence, sso_urls=sso_urls, known_resources=known_sso)
         self.collect_git(persistence, git_urls=git_urls)
 
         logger.info("Web scraping was completed successfully")
@@ -91,19 +201,26 @@ class ScraperManager:
     def collect_links(
         self,
         persistence: PersistenceService,
-        link_urls: List[str] = [],
+        link_urls: Optional[List[str]] = None,
         max_depth: Optional[int] = None,
+        validators: Optional[Dict[str, Dict[str, str]]] = None,
+        known_resources: Optional[Dict[str, Dict[str, str]]] = None,
     ) -> int:
-        """Collect only standard link sources. Returns count of resources scraped."""
+        """
+        Collect only standard link sources. Returns count of resources scraped.
+        ``known_resources`` maps resource hashes to their stored content_hash/etag/last_modified;
+        without it each scraped page is looked up in the catalog on its own.
+        """
         if not self.links_enabled:
             logger.info("Links disabled, skipping link scraping")
             return 0
         if not link_urls:
             return 0
         websites_dir = persistence.data_path / "websites"
-        if not os.path.exists(websites_dir):
-            os.makedirs(websites_dir, exist_ok=True)
-        return self._collect_links_from_urls(link_urls, persistence, websites_dir, max_depth=max_depth)
+        self._prepare_dir(websites_dir)
+        return self._collect_links_from_urls(
+            link_urls, persistence, websites_dir, max_depth=max_depth, validators=validators, known_resources=known_resources
+        )
 
     def collect_git(
         self,
@@ -117,14 +234,15 @@ class ScraperManager:
         if not git_urls:
             return
         git_dir = persistence.data_path / "git"
-        if not os.path.exists(git_dir):
-            os.makedirs(git_dir, exist_ok=True)
+        self._prepare_dir(git_dir)
         self._collect_git_resources(git_urls, persistence, git_dir)
 
     def collect_sso(
         self,
         persistence: PersistenceService,
         sso_urls: Optional[List[str]] = None,
+        validators: Optional[Dict[str, Dict[str, str]]] = None,
+        known_resources: Optional[Dict[str, Dict[str, str]]] = None,
     ) -> None:
         """Collect only SSO sources."""
         if not self.sso_enabled:
@@ -134,30 +252,64 @@ class ScraperManager:
         if not sso_urls:
             return
         sso_dir = persistence.data_path / "sso"
-        if not os.path.exists(sso_dir):
-            os.makedirs(sso_dir, exist_ok=True)
-        self._collect_sso_from_urls(sso_urls, persistence, sso_dir)
+        self._prepare_dir(sso_dir)
+        self._collect_sso_from_urls(sso_urls, persistence, sso_dir, validators=validators, known_resources=known_resources)
 
     def schedule_collect_links(self, persistence: PersistenceService, last_run: Optional[str] = None) -> None:
         """
         Scheduled collection of link sources.
         For now, this behaves the same as a full collection, overriding last_run depending on the persistence layer.
         """
-        metadata = persistence.catalog.get_metadata_by_filter("source_type", source_type="web", metadata_keys=["url"])
+        metadata = self._get_catalog_metadata(persistence, "web")
         catalog_urls = [m[1].get("url", "").strip() for m in metadata]
         catalog_urls = [u for u in catalog_urls if u]
         logger.info("Scheduled links collection found %d URL(s) in catalog", len(catalog_urls))
-        self.collect_links(persistence, link_urls=catalog_urls)
+        self.collect_links(
+            persistence,
+            link_urls=catalog_urls,
+            validators=self._validators_from_metadata(metadata),
+            known_resources=self._known_resources_from_metadata(metadata),
+        )
 
     def schedule_collect_git(self, persistence: PersistenceService, last_run: Optional[str] = None) -> None:
-        metadata = persistence.catalog.get_metadata_by_filter("source_type", source_type="git", metadata_keys=["url"])
+        metadata = self._get_catalog_metadata(persistence, "git")
         catalog_urls = [m[1].get("url", "") for m in metadata]
         self.collect_git(persistence, git_urls=catalog_urls)
 
     def schedule_collect_sso(self, persistence: PersistenceService, last_run: Optional[str] = None) -> None:
-        metadata = persistence.catalog.get_metadata_by_filter("source_type", source_type="sso", metadata_keys=["url"])
+        metadata = self._get_catalog_metadata(persistence, "sso")
         catalog_urls = [m[1].get("url", "") for m in metadata]
-        self.collect_sso(persistence, sso_urls=catalog_urls)
+        self.collect_sso(
+            persistence,
+            sso_urls=catalog_urls,
+            validators=self._validators_from_metadata(metadata),
+            known_resources=self._known_resources_from_metadata(metadata),
+        )
+
+    def _get_catalog_metadata(self, persistence: PersistenceService, source_type: str):
+        """
+        Catalog metadata for one source type. A scheduled run queries it once and derives the url list,
+        the cache validators and the stored content hashes from the same rows.
+        """
+        return persistence.catalog.get_metadata_by_filter(
+            "source_type", source_type=source_type, metadata_keys=CATALOG_METADATA_KEYS
+        )
+
+    def _validators_from_metadata(self, metadata) -> Optional[Dict[str, Dict[str, str]]]:
+        """Map catalog urls to the etag/last_modified stored when they were last scraped."""
+        if not self.incremental_sync_enabled:
+            return None
+        validators: Dict[str, Dict[str, str]] = {}
+        for _, meta in metadata:
+            url = (meta.get("url") or "").strip()
+            stored = {key: meta[key] for _, key in VALIDATOR_HEADERS if meta.get(key)}
+            if url and stored:
+                validators[url] = stored
+        return validators
+
+    def close(self) -> None:
+        """Release pooled HTTP connections held by the shared session."""
+        self.http_session.close()
 
     def _collect_links_from_urls(
         self,
@@ -165,6 +317,8 @@ class ScraperManager:
         persistence: PersistenceService,
         output_dir: Path,
         max_depth: Optional[int] = None,
+        validators: Optional[Dict[str, Dict[str, str]]] = None,
+        known_resources: Optional[Dict[str, Dict[str, str]]] = None,
     ) -> int:
         """Collect links from URLs and return total count of resources scraped."""
         # Initialize authenticator if selenium is enabled
@@ -174,30 +328,81 @@ class ScraperManager:
             if authenticator_class is not None:
                 authenticator = authenticator_class(**kwargs)
 
+        depth = max_depth if max_depth is not None else self.base_depth
+        # max_pages caps the whole run, not each seed
+        page_budget = _PageBudget(self.max_pages) if self.max_pages is not None else None
         total_count = 0
         try:
-            for url in urls:
-                # For standard link collection, don't use selenium for scraping
-                # (SSO urls are handled separately via collect_sso)
-                count = self._handle_standard_url(
-                    url, 
-                    persistence, 
-                    output_dir, 
-                    max_depth=max_depth if max_depth is not None else self.base_depth,
-                    client=None,
-                    use_client_for_scraping=False
+            if self.parallel_seeds > 1 and len(urls) > 1:
+                total_count = self._collect_links_in_parallel(
+                    urls, persistence, output_dir, depth, validators, known_resources, page_budget
                 )
-                total_count += count
+            else:
+                for url in urls:
+                    if page_budget is not None and page_budget.exhausted:
+                        logger.info(f"Reached max_pages={self.max_pages}; skipping remaining seed URLs.")
+                        break
+                    # For standard link collection, don't use selenium for scraping
+                    # (SSO urls are handled separately via collect_sso)
+                    count = self._handle_standard_url(
+                        url, 
+                        persistence, 
+                        output_dir, 
+                        max_depth=depth,
+                        client=None,
+                        use_client_for_scraping=False,
+                        validators=validators,
+                        known_resources=known_resources,
+                        page_budget=page_budget,
+                    )
+                    total_count += count
         finally:
             if authenticator is not None:
                 authenticator.close()  # Close the authenticator properly and free the resources
         return total_count
 
+    def _collect_links_in_parallel(
+        self,
+        urls: List[str],
+        persistence: PersistenceService,
+        output_dir: Path,
+        max_depth: int,
+        validators: Optional[Dict[str, Dict[str, str]]] = None,
+        known_resources: Optional[Dict[str, Dict[str, str]]] = None,
+        page_budget: Optional[_PageBudget] = None,
+    ) -> int:
+        """
+        Crawl several seed URLs at once. Crawl state lives on the LinkScraper, so every
+        seed gets its own scraper; they share the per-host rate limiter so concurrent
+        seeds on one host stay polite.
+        """
+        total_count = 0
+        with ThreadPoolExecutor(max_workers=min(self.parallel_seeds, len(urls))) as executor:
+            futures = {
+                executor.submit(
+                    self._handle_standard_url,
+                    url,
+                    persistence,
+                    output_dir,
+                    max_depth=max_depth,
+                    scraper=self._new_link_scraper(rate_limiter=self.web_scraper.rate_limiter),
+                    validators=validators,
+                    known_resources=known_resources,
+                    page_budget=page_budget,
+                ): url
+                for url in urls
+            }
+            for future in as_completed(futures):
+                total_count += future.result()
+        return total_count
+
     def _collect_sso_from_urls(
         self,
         urls: List[str],
         persistence: PersistenceService,
         output_dir: Path,
+        validators: Optional[Dict[str, Dict[str, str]]] = None,
+        known_resources: Optional[Dict[str, Dict[str, str]]] = None,
     ) -> None:
         """Collect SSO-protected URLs using selenium for authentication."""
         if not self.selenium_enabled:
@@ -226,13 +431,17 @@ class ScraperManager:
                     output_dir,
                     max_depth=self.base_depth,
                     client=authenticator,
-                    use_client_for_scraping=self.scrape_with_selenium
+                    use_client_for_scraping=self.scrape_with_selenium,
+                    validators=validators,
+                    known_resources=known_resources,
                 )
         finally:
             if authenticator is not None:
                 authenticator.close()
 
     def _ensure_sso_defaults(self) -> None:
+        if self._sso_defaults_applied:
+            return
         if not self.selenium_config:
             self.selenium_config = {}
 
@@ -252,37 +461,34 @@ class ScraperManager:
                     "max_depth": 2,
                 },
             }
+        self._sso_defaults_applied = True
 
-    def _collect_urls_from_lists(self, input_lists) -> List[str]:
-        """Collect URLs from the configured weblists."""
+    def _collect_urls_from_lists(self, input_lists: Optional[List[str]]) -> Iterator[str]:
+        """Yield URLs from the configured weblists."""
         # Handle case where input_lists might be None
-        urls: List[str] = []
         if not input_lists:
-            return urls
+            return
         for list_name in input_lists:
             list_path = Path("weblists") / Path(list_name).name
             if not list_path.exists():
                 logger.warning(f"Input list {list_path} not found.")
                 continue
 
-            urls.extend(self._extract_urls_from_file(list_path))
-
-        return urls
+            yield from self._extract_urls_from_file(list_path)
 
-    def _collect_urls_from_lists_by_type(self, input_lists: List[str]) -> tuple[List[str], List[str], List[str]]:
+    def _collect_urls_from_lists_by_type(self, input_lists: Optional[List[str]]) -> tuple[List[str], List[str], List[str]]:
         """All types of URLs are in the same input lists, separate them via prefixes"""
         link_urls: List[str] = []
-        git_urls: List[str] = []
-        sso_urls: List[str] = []
+        buckets: Dict[str, List[str]] = {prefix: [] for prefix in SOURCE_URL_PREFIXES}
         for raw_url in self._collect_urls_from_lists(input_lists):
-            if raw_url.startswith("git-"):
-                git_urls.append(raw_url.split("git-", 1)[1])
-                continue
-            if raw_url.startswith("sso-"):
-                sso_urls.append(raw_url.split("sso-", 1)[1])
+            if raw_url.startswith(SOURCE_URL_PREFIXES):
+                source, separator, url = raw_url.partition("-")
+                buckets[source + separator].append(url)
                 continue
             link_urls.append(raw_url)
-        return link_urls, git_urls, sso_urls
+        # the same seed often appears in several weblists; crawling it twice repeats the whole crawl
+        git_urls, sso_urls = (list(dict.fromkeys(buckets[prefix])) for prefix in SOURCE_URL_PREFIXES)
+        return list(dict.fromkeys(link_urls)), git_urls, sso_urls
     def _resolve_scraper(self):
         class_name = self.selenium_config.get("selenium_class")
         class_map = self.selenium_config.get("selenium_class_map", {})
@@ -300,9 +506,9 @@ class ScraperManager:
                     "module", 
                     "src.data_manager.collectors.scrapers.integrations.sso_scraper",
                     )
-            module = importlib.import_module(module_name)
-            scraper_class = getattr(module, scraper_class)
-        scraper_kwargs = entry.get("kwargs", {})
+            scraper_class = _resolve_class(scraper_class, module_name)
+        # copy so the configured kwargs are not mutated on every resolution
+        scraper_kwargs = dict(entry.get("kwargs", {}))
         scraper_kwargs["selenium_url"] = selenium_url
         return scraper_class, scraper_kwargs
 
@@ -315,39 +521,163 @@ class ScraperManager:
             max_depth: int, 
             client=None, 
             use_client_for_scraping: bool = False,
+            scraper: Optional[LinkScraper] = None,
+            validators: Optional[Dict[str, Dict[str, str]]] = None,
+            known_resources: Optional[Dict[str, Dict[str, str]]] = None,
+            page_budget: Optional[_PageBudget] = None,
     ) -> int:
         """Scrape a URL and persist resources. Returns count of resources scraped."""
+        scraper = scraper or self.web_scraper
         count = 0
+        unchanged = 0
+        # (resource, overwrite) pairs waiting to be written
+        batch: List[Tuple[ScrapedResource, bool]] = []
+        resources = scraper.crawl_iter(
+            url,
+            browserclient=client,
+            max_depth=max_depth,
+            selenium_scrape=use_client_for_scraping,
+            max_pages=page_budget.remaining if page_budget is not None else self.max_pages,
+            validators=validators,
+            # charged per fetched page, pages filtered out by path rules included, as max_pages is per crawl
+            claim_page=page_budget.take if page_budget is not None else None,
+        )
+        if client is None:
+            # overlap fetching the next pages with persisting the current ones;
+            # a browser client stays on the calling thread
+            resources = _iter_in_background(resources)
         try:
-            for resource in self.web_scraper.crawl_iter(
-                url,
-                browserclient=client,
-                max_depth=max_depth,
-                selenium_scrape=use_client_for_scraping,
-                max_pages=self.max_pages,
-            ):
-                persistence.persist_resource(
-                    resource, output_dir
-                )
+            for resource in resources:
                 count += 1
-            logger.info(f"Scraped {count} resources from {url}")
+                # with delta detection on, changed pages replace their stale files; otherwise the old file
+                # would stay while its new content_hash marks it unchanged on every later run
+                replace = self.delta_enabled
+                if self.delta_enabled:
+                    stored = self._stored_state(persistence, resource, known_resources)
+                    if stored.get("content_hash") == resource.get_content_hash():
+                        if self._validators_match(stored, resource) and resource.get_file_path(output_dir).exists():
+                            unchanged += 1
+                            continue
+                        # same body: restore the file if it went missing and record new validators,
+                        # so the page stays indexed and conditional requests keep working
+                        replace = False
+                batch.append((resource, replace))
+                if len(batch) >= PERSIST_BATCH_SIZE:
+                    # hand the batch off first so a failed write is not retried by the final flush
+                    pending, batch = batch, []
+                    if not self._persist_batch(persistence, pending, output_dir, url):
+                        logger.info(f"Stopping crawl of {url} after a persistence failure.")
+                        break
+            logger.info(f"Scraped {count} resources from {url} ({unchanged} unchanged)")
         except Exception as exc:
             logger.error(f"Failed to scrape {url}: {exc}", exc_info=exc)
+        finally:
+            # stops a crawl left early (e.g. on a persistence failure) and its producer thread
+            resources.close()
+            # pages fetched before a crawl error are still worth keeping
+            self._persist_batch(persistence, batch, output_dir, url)
+            if scraper is not self.web_scraper:
+                scraper.close()
         return count
 
-    def _extract_urls_from_file(self, path: Path) -> List[str]:
+    def _persist_batch(
+        self,
+        persistence: PersistenceService,
+        batch: List[Tuple[ScrapedResource, bool]],
+        output_dir: Path,
+        url: str,
+    ) -> bool:
+        """Write (resource, overwrite) pairs scraped from ``url``; persistence failures are logged, not raised."""
+        if not batch:
+            return True
+        resources = [resource for resource, _ in batch]
+        overwrite = [replace for _, replace in batch]
+        try:
+            # seeds may be crawled concurrently; keep catalog writes one at a time
+            with self._persist_lock:
+                persistence.persist_resources_batch(resources, output_dir, overwrite=overwrite)
+        except Exception as exc:
+            logger.error(f"Failed to persist {len(batch)} resources scraped from {url}: {exc}", exc_info=exc)
+            return False
+        return True
+
+    def _stored_state(
+        self,
+        persistence: PersistenceService,
+        resource: ScrapedResource,
+        known_resources: Optional[Dict[str, Dict[str, str]]] = None,
+    ) -> Dict[str, str]:
+        """Content hash and validators the catalog holds for this resource, from ``known_resources`` or a single lookup."""
+        if known_resources is not None:
+            return known_resources.get(resource.get_hash(), {})
+        try:
+            stored = persistence.catalog.get_metadata_for_hash(resource.get_hash())
+        except Exception as exc:
+            logger.warning(f"Could not look up stored content hash for {resource.url}; persisting it: {exc}")
+            return {}
+        return {key: stored[key] for key in DELTA_METADATA_KEYS if (stored or {}).get(key)}
+
+    @staticmethod
+    def _validators_match(stored: Dict[str, str], resource: ScrapedResource) -> bool:
+        return all(stored.get(key) == resource.metadata.get(key) for _, key in VALIDATOR_HEADERS)
+
+    def _load_known_resources(self, persistence: PersistenceService, source_type: str) -> Dict[str, Dict[str, str]]:
+        """Resource hash -> stored content hash and validators of what is already stored for this source type."""
+        if not self.delta_enabled:
+            return {}
+        try:
+            metadata = persistence.catalog.get_metadata_by_filter(
+                "source_type", source_type=source_type, metadata_keys=DELTA_METADATA_KEYS
+            )
+        except Exception as exc:
+            logger.warning(f"Could not load stored content hashes; persisting every resource: {exc}")
+            return {}
+        return self._known_resources_from_metadata(metadata)
+
+    def _known_resources_from_metadata(self, metadata) -> Dict[str, Dict[str, str]]:
+        """Resource hash -> stored content hash and validators, taken from catalog rows the caller already holds."""
+        if not self.delta_enabled:
+            return {}
+        return {
+            resource_hash: {key: meta[key] for key in DELTA_METADATA_KEYS if meta.get(key)}
+            for resource_hash, meta in metadata
+            if meta.get("content_hash")
+        }
+
+    def _prepare_dir(self, path: Path) -> None:
+        """Create an output directory the first time it is used by this manager."""
+        if path not in self._dirs_prepared:
+            path.mkdir(parents=True, exist_ok=True)
+            self._dirs_prepared.add(path)
+
+    def _new_link_scraper(self, rate_limiter: Optional[HostRateLimiter] = None) -> LinkScraper:
+        return LinkScraper(
+            verify_urls=self.config.get("verify_urls", False),  # Default to False for broader compatibility
+            enable_warnings=self.config.get("enable_warnings", False),
+            allowed_path_regexes=self._allowed_path_patterns,
+            denied_path_regexes=self._denied_path_patterns,
+            rate_limiter=rate_limiter,
+            session=self.http_session,
+        )
+
+    @staticmethod
+    def _read_parallel_seeds() -> int:
+        raw = os.environ.get("SCRAPER_RUNNER_PARALLEL", "1")
+        try:
+            return max(1, int(raw))
+        except ValueError:
+            logger.warning(f"Invalid SCRAPER_RUNNER_PARALLEL value {raw}; crawling seeds sequentially.")
+            return 1
+
+    def _extract_urls_from_file(self, path: Path) -> Iterator[str]:
         """Extract URLs from file, ignoring depth specifications for now."""
-        urls: List[str] = []
         with path.open("r") as file:
             for line in file:
                 stripped = line.strip()
                 if not stripped or stripped.startswith("#"):
                     continue
                 # Extract just the URL part, ignoring depth specification if present
-                url_depth = stripped.split(",")
-                url = url_depth[0].strip()
-                urls.append(url)
-        return urls
+                yield stripped.partition(",")[0].rstrip()
 
     def _collect_git_resources(
         self,
@@ -357,8 +687,8 @@ class ScraperManager:
     ) -> List[ScrapedResource]:
         git_scraper = self._get_git_scraper()
         resources = git_scraper.collect(git_urls)
-        for resource in resources:
-            persistence.persist_resource(resource, git_dir)
+        for start in range(0, len(resources), PERSIST_BATCH_SIZE):
+            persistence.persist_resources_batch(resources[start:start + PERSIST_BATCH_SIZE], git_dir)
         return resources
 
     def _get_git_scraper(self) -> "GitScraper":
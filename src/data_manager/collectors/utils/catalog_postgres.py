@@ -48,6 +48,47 @@ _METADATA_COLUMN_MAP = {
 }
 
 
+_UPSERT_DOCUMENT_SQL = """
+    INSERT INTO documents (
+        resource_hash,
+        file_path,
+        display_name,
+        source_type,
+        url,
+        ticket_id,
+        suffix,
+        size_bytes,
+        original_path,
+        base_path,
+        relative_path,
+        file_modified_at,
+        ingested_at,
+        ingestion_status,
+        extra_json,
+        extra_text,
+        is_deleted
+    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, 'pending', %s, %s, FALSE)
+    ON CONFLICT (resource_hash) DO UPDATE SET
+        file_path = EXCLUDED.file_path,
+        display_name = EXCLUDED.display_name,
+        source_type = EXCLUDED.source_type,
+        url = EXCLUDED.url,
+        ticket_id = EXCLUDED.ticket_id,
+        suffix = EXCLUDED.suffix,
+        size_bytes = EXCLUDED.size_bytes,
+        original_path = EXCLUDED.original_path,
+        base_path = EXCLUDED.base_path,
+        relative_path = EXCLUDED.relative_path,
+        file_modified_at = EXCLUDED.file_modified_at,
+        ingested_at = EXCLUDED.ingested_at,
+        extra_json = EXCLUDED.extra_json,
+        extra_text = EXCLUDED.extra_text,
+        is_deleted = FALSE,
+        deleted_at = NULL
+    RETURNING id
+"""
+
+
 @dataclass
 class PostgresCatalogService:
     """
@@ -156,82 +197,36 @@ class PostgresCatalogService:
         Returns:
             The document ID (for linking to document_chunks)
         """
-        payload = metadata or {}
-        display_name = payload.get("display_name") or resource_hash
-        source_type = payload.get("source_type") or "unknown"
+        return self.upsert_resources([(resource_hash, path, metadata)])[0]
 
-        # Build extra_json from non-column fields
-        extra = dict(payload)
-        for key in _METADATA_COLUMN_MAP:
-            extra.pop(key, None)
-        extra_json = json.dumps(extra, sort_keys=True) if extra else None
-        extra_text = _build_extra_text(payload)
+    def upsert_resources(
+        self,
+        entries: Sequence[Tuple[str, str, Optional[Dict[str, str]]]],
+    ) -> List[int]:
+        """
+        Insert or update several (resource_hash, path, metadata) entries on one connection
+        and commit them as a single transaction.
+
+        Returns:
+            The document IDs, in the order of ``entries``
+        """
+        if not entries:
+            return []
 
+        document_ids: List[int] = []
         with self._connect() as conn:
             with conn.cursor() as cur:
-                cur.execute("""
-                    INSERT INTO documents (
-                        resource_hash,
-                        file_path,
-                        display_name,
-                        source_type,
-                        url,
-                        ticket_id,
-                        suffix,
-                        size_bytes,
-                        original_path,
-                        base_path,
-                        relative_path,
-                        file_modified_at,
-                        ingested_at,
-                        ingestion_status,
-                        extra_json,
-                        extra_text,
-                        is_deleted
-                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, 'pending', %s, %s, FALSE)
-                    ON CONFLICT (resource_hash) DO UPDATE SET
-                        file_path = EXCLUDED.file_path,
-                        display_name = EXCLUDED.display_name,
-                        source_type = EXCLUDED.source_type,
-                        url = EXCLUDED.url,
-                        ticket_id = EXCLUDED.ticket_id,
-                        suffix = EXCLUDED.suffix,
-                        size_bytes = EXCLUDED.size_bytes,
-                        original_path = EXCLUDED.original_path,
-                        base_path = EXCLUDED.base_path,
-                        relative_path = EXCLUDED.relative_path,
-                        file_modified_at = EXCLUDED.file_modified_at,
-                        ingested_at = EXCLUDED.ingested_at,
-                        extra_json = EXCLUDED.extra_json,
-                        extra_text = EXCLUDED.extra_text,
-                        is_deleted = FALSE,
-                        deleted_at = NULL
-                    RETURNING id
-                """, (
-                    resource_hash,
-                    path,
-                    display_name,
-                    source_type,
-                    payload.get("url"),
-                    payload.get("ticket_id"),
-                    payload.get("suffix"),
-                    _coerce_int(payload.get("size_bytes")),
-                    payload.get("original_path"),
-                    payload.get("base_path"),
-                    payload.get("relative_path"),
-                    _parse_timestamp(payload.get("modified_at") or payload.get("file_modified_at")),
-                    _parse_timestamp(payload.get("ingested_at")),
-                    extra_json,
-                    extra_text,
-                ))
-                document_id = cur.fetchone()[0]
+                for resource_hash, path, metadata in entries:
+                    cur.execute(_UPSERT_DOCUMENT_SQL, _document_row(resource_hash, path, metadata))
+                    document_ids.append(cur.fetchone()[0])
             conn.commit()
 
-        self._file_index[resource_hash] = path
-        self._metadata_index[resource_hash] = path
-        self._id_cache[resource_hash] = document_id
-        
-        return document_id
+        for (resource_hash, path, _), document_id in zip(entries, document_ids):
+            self._file_index[resource_hash] = path
+            self._metadata_index[resource_hash] = path
+            self._id_cache[resource_hash] = document_id
+
+        return document_ids
 
     def delete_resource(self, resource_hash: str) -> None:
         """Soft-delete a resource."""
@@ -1248,6 +1243,38 @@ class PostgresCatalogService:
         return resolved
 
 
+def _document_row(resource_hash: str, path: str, metadata: Optional[Dict[str, str]]) -> Tuple[Any, ...]:
+    """Parameters for _UPSERT_DOCUMENT_SQL built from a resource's metadata payload."""
+    payload = metadata or {}
+    display_name = payload.get("display_name") or resource_hash
+    source_type = payload.get("source_type") or "unknown"
+
+    # Build extra_json from non-column fields
+    extra = dict(payload)
+    for key in _METADATA_COLUMN_MAP:
+        extra.pop(key, None)
+    extra_json = json.dumps(extra, sort_keys=True) if extra else None
+    extra_text = _build_extra_text(payload)
+
+    return (
+        resource_hash,
+        path,
+        display_name,
+        source_type,
+        payload.get("url"),
+        payload.get("ticket_id"),
+        payload.get("suffix"),
+        _coerce_int(payload.get("size_bytes")),
+        payload.get("original_path"),
+        payload.get("base_path"),
+        payload.get("relative_path"),
+        _parse_timestamp(payload.get("modified_at") or payload.get("file_modified_at")),
+        _parse_timestamp(payload.get("ingested_at")),
+        extra_json,
+        extra_text,
+    )
+
+
 def _coerce_int(value: Optional[str]) -> Optional[int]:
     """Coerce a value to int or None."""
     if value is None:
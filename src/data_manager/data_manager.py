@@ -106,6 +106,10 @@ class DataManager():
             return None
         self.vector_manager.update_vectorstore()
 
+    def close(self) -> None:
+        """Release resources held by the collectors (pooled scraper HTTP connections)."""
+        self.scraper_manager.close()
+
     def _update_after_collect(self) -> None:
         self.persistence.flush_index()
         self.vector_manager.update_vectorstore()
@@ -111,7 +111,10 @@ class FlaskAppWrapper:
         self.app.add_url_rule(endpoint, endpoint_name, handler, methods=methods or ["GET"])
 
     def run(self, **kwargs):
-        self.app.run(**kwargs)
+        try:
+            self.app.run(**kwargs)
+        finally:
+            self.scraper_manager.close()
 
     def require_admin(self, handler):
         @wraps(handler)
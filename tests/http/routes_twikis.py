@@ -1,16 +1,22 @@
 from typing import List
-from functools import partial
+from functools import lru_cache, partial
+from types import MappingProxyType
 from tests.http.offline_router import RouteTable, RouteValue
 
+_DOCTYPE = "<!doctype html><html><body>"
+_CLOSE = "</body></html>"
+
 def make_links_html(base_url: str, paths: List[str]) -> RouteValue:
     anchors = "".join(f'<a href="{base_url}/{p}">{p}</a>' for p in paths)
-    return (200, f"<!doctype html><html><body>{anchors}</body></html>")
+    return (200, f"{_DOCTYPE}{anchors}{_CLOSE}")
 
+# route tables are static, so each is built once per test session and handed out read-only
+@lru_cache(maxsize=None)
 def twiki_routes() -> RouteTable:
     """Route table: URL -> (status_code, body)."""
     base = "https://twiki.test/CMSPublic"
     twiki = partial(make_links_html, base)
-    return {
+    return MappingProxyType({
         f"{base}/SWGuide": twiki(
             ["SWGuide", "SWGuideDQM", "SWGuideReco", "SWGuideHiggs", "SWGuideMuons", "SWGuideCrab"]
         ),
@@ -52,13 +58,14 @@ def twiki_routes() -> RouteTable:
         f"{base}/CRAB3FAQ": (200, "CRAB3FAQ"),
         # Example: that should be discarded, by the scraper since has different hostname
         "https://example.test/missing": (404, "404 Not Found"),
-    }
+    })
 
+@lru_cache(maxsize=None)
 def deep_wiki_routes() -> RouteTable:
     base = "https://deepwiki.test/dmwm/CRABServer"
     deepwiki = partial(make_links_html, base)
-    return {
+    return MappingProxyType({
         f"{base}/1-overview": deepwiki(["1.1-system-architecture", "1.2-key-concepts-and-terminology"]),
         f"{base}/1.1-system-architecture": (200, "1.1-system-architecture"),
         f"{base}/1.2-key-concepts-and-terminology": (200, "1.2-key-concepts-and-terminology"),
-    }
+    })
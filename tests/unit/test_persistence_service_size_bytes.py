@@ -78,3 +78,27 @@ def test_persist_resource_sets_size_bytes_from_written_file():
         service.catalog.upsert_resource.assert_called_once()
         _, _, metadata = service.catalog.upsert_resource.call_args[0]
         assert metadata["size_bytes"] == str(len("hello persistence"))
+
+
+def test_persist_resources_batch_records_all_resources_in_one_catalog_call():
+    with TemporaryDirectory() as tmp_dir:
+        service = PersistenceService.__new__(PersistenceService)
+        service.data_path = Path(tmp_dir)
+        service.catalog = MagicMock()
+
+        resources = [
+            _FakeResource("hash-1", "one.txt", "first"),
+            _FakeResource("hash-2", "two.txt", "second resource"),
+        ]
+        target_dir = service.data_path / "tickets"
+        persisted_paths = service.persist_resources_batch(resources, target_dir)
+
+        assert all(path.exists() for path in persisted_paths)
+        service.catalog.upsert_resource.assert_not_called()
+        service.catalog.upsert_resources.assert_called_once()
+        (entries,) = service.catalog.upsert_resources.call_args[0]
+        assert [(resource_hash, path) for resource_hash, path, _ in entries] == [
+            ("hash-1", "tickets/one.txt"),
+            ("hash-2", "tickets/two.txt"),
+        ]
+        assert entries[1][2]["size_bytes"] == str(len("second resource"))
@@ -0,0 +1,332 @@
+import itertools
+import sys
+import threading
+import types
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+# Minimal stub so the manager can be imported without langchain-community installed.
+try:
+    import langchain_community.document_loaders  # noqa: F401
+except ImportError:
+    sys.modules.setdefault("langchain_community", types.ModuleType("langchain_community"))
+    loaders_module = types.ModuleType("langchain_community.document_loaders")
+    text_module = types.ModuleType("langchain_community.document_loaders.text")
+
+    class _DummyLoader:
+        def __init__(self, *_args, **_kwargs):
+            pass
+
+        def load(self):
+            return []
+
+    for name in ("BSHTMLLoader", "PyPDFLoader", "PythonLoader", "TextLoader"):
+        setattr(loaders_module, name, _DummyLoader)
+    text_module.TextLoader = _DummyLoader
+    sys.modules.setdefault("langchain_community.document_loaders", loaders_module)
+    sys.modules.setdefault("langchain_community.document_loaders.text", text_module)
+
+from src.data_manager.collectors.persistence import PersistenceService
+from src.data_manager.collectors.scrapers import scraper_manager as manager_module
+from src.data_manager.collectors.scrapers.scraper import HostRateLimiter
+from tests.http.offline_router import OfflineRouter
+
+BASE = "https://twiki.test/Site"
+
+
+class _FakeCatalog:
+    """In-memory stand-in for PostgresCatalogService, keyed by resource hash."""
+
+    def __init__(self):
+        self.metadata = {}
+        self.upserts = []
+
+    def upsert_resources(self, entries):
+        for resource_hash, _path, metadata in entries:
+            self.metadata[resource_hash] = dict(metadata)
+            self.upserts.append(resource_hash)
+
+    def get_metadata_by_filter(self, metadata_field, value=None, metadata_keys=None, **kwargs):
+        source_type = kwargs.get("source_type", value)
+        return [
+            (resource_hash, dict(meta))
+            for resource_hash, meta in self.metadata.items()
+            if meta.get("source_type") == source_type
+        ]
+
+    def get_metadata_for_hash(self, resource_hash):
+        meta = self.metadata.get(resource_hash)
+        return dict(meta) if meta is not None else None
+
+
+def _page(*links):
+    return "<html><body>" + "".join(f'<a href="{link}">{link}</a>' for link in links) + "</body></html>"
+
+
+def _make_manager(tmp_path: Path, monkeypatch, html_scraper=None, **links_config) -> "manager_module.ScraperManager":
+    monkeypatch.setattr(manager_module, "get_global_config", lambda: {"DATA_PATH": str(tmp_path)})
+    links_config["html_scraper"] = html_scraper or {}
+    manager = manager_module.ScraperManager({"sources": {"links": links_config}})
+    manager.web_scraper.rate_limiter = HostRateLimiter(delay=0)
+    return manager
+
+
+def _make_persistence(tmp_path: Path) -> PersistenceService:
+    persistence = PersistenceService.__new__(PersistenceService)
+    persistence.data_path = tmp_path
+    persistence.catalog = _FakeCatalog()
+    return persistence
+
+
+def test_collect_links_crawls_seeds_in_parallel(http_router: OfflineRouter, tmp_path, monkeypatch):
+    monkeypatch.setenv("SCRAPER_RUNNER_PARALLEL", "2")
+    http_router.add_routes({
+        f"{BASE}/A": (200, _page(f"{BASE}/A1")),
+        f"{BASE}/A1": (200, _page()),
+        f"{BASE}/B": (200, _page(f"{BASE}/B1")),
+        f"{BASE}/B1": (200, _page()),
+    })
+    manager = _make_manager(tmp_path, monkeypatch)
+    persistence = _make_persistence(tmp_path)
+
+    seed_scrapers = []
+    new_link_scraper = manager._new_link_scraper
+
+    def spy(rate_limiter=None):
+        scraper = new_link_scraper(rate_limiter=rate_limiter)
+        scraper.close = MagicMock(wraps=scraper.close)
+        seed_scrapers.append(scraper)
+        return scraper
+
+    monkeypatch.setattr(manager, "_new_link_scraper", spy)
+
+    count = manager.collect_links(persistence, link_urls=[f"{BASE}/A", f"{BASE}/B"], max_depth=2)
+
+    assert manager.parallel_seeds == 2
+    assert count == 4
+    assert len(persistence.catalog.metadata) == 4
+    assert len(seed_scrapers) == 2
+    assert all(scraper.rate_limiter is manager.web_scraper.rate_limiter for scraper in seed_scrapers)
+    assert all(scraper.close.call_count == 1 for scraper in seed_scrapers)
+
+
+def _stored_file(persistence: PersistenceService, url: str) -> Path:
+    (resource_hash, meta), = [
+        (resource_hash, meta) for resource_hash, meta in persistence.catalog.metadata.items() if meta["url"] == url
+    ]
+    return next((persistence.data_path / "websites").glob(f"{resource_hash}*"))
+
+
+def test_collect_links_skips_unchanged_pages(http_router: OfflineRouter, tmp_path, monkeypatch):
+    http_router.add_routes({f"{BASE}/A": (200, _page())})
+    manager = _make_manager(tmp_path, monkeypatch)
+    persistence = _make_persistence(tmp_path)
+
+    assert manager.collect_links(persistence, link_urls=[f"{BASE}/A"], max_depth=1) == 1
+    assert manager.collect_links(persistence, link_urls=[f"{BASE}/A"], max_depth=1) == 1
+    manager.schedule_collect_links(persistence)
+
+    assert len(persistence.catalog.upserts) == 1
+
+
+def test_collect_links_overwrites_changed_pages(http_router: OfflineRouter, tmp_path, monkeypatch):
+    http_router.add_routes({f"{BASE}/A": (200, _page(f"{BASE}/old"))})
+    manager = _make_manager(tmp_path, monkeypatch)
+    persistence = _make_persistence(tmp_path)
+    manager.collect_links(persistence, link_urls=[f"{BASE}/A"], max_depth=1)
+    first_hash = next(iter(persistence.catalog.metadata.values()))["content_hash"]
+
+    http_router.add_routes({f"{BASE}/A": (200, _page(f"{BASE}/new"))})
+    manager.schedule_collect_links(persistence)
+
+    assert len(persistence.catalog.upserts) == 2
+    assert next(iter(persistence.catalog.metadata.values()))["content_hash"] != first_hash
+    assert f"{BASE}/new" in _stored_file(persistence, f"{BASE}/A").read_text()
+
+
+def test_collect_links_overwrites_pages_stored_without_a_content_hash(http_router: OfflineRouter, tmp_path, monkeypatch):
+    http_router.add_routes({f"{BASE}/A": (200, _page(f"{BASE}/old"))})
+    manager = _make_manager(tmp_path, monkeypatch)
+    persistence = _make_persistence(tmp_path)
+    manager.collect_links(persistence, link_urls=[f"{BASE}/A"], max_depth=1)
+    # catalog entries written before delta detection carry no content_hash
+    for meta in persistence.catalog.metadata.values():
+        del meta["content_hash"]
+
+    http_router.add_routes({f"{BASE}/A": (200, _page(f"{BASE}/new"))})
+    manager.collect_links(persistence, link_urls=[f"{BASE}/A"], max_depth=1)
+
+    assert f"{BASE}/new" in _stored_file(persistence, f"{BASE}/A").read_text()
+    manager.collect_links(persistence, link_urls=[f"{BASE}/A"], max_depth=1)
+    assert len(persistence.catalog.upserts) == 2
+
+
+def test_collect_links_persists_every_page_when_delta_is_disabled(http_router: OfflineRouter, tmp_path, monkeypatch):
+    http_router.add_routes({f"{BASE}/A": (200, _page())})
+    manager = _make_manager(tmp_path, monkeypatch, html_scraper={"delta_enabled": False})
+    persistence = _make_persistence(tmp_path)
+    persistence.catalog.get_metadata_for_hash = MagicMock(side_effect=AssertionError("no hash lookups expected"))
+
+    manager.collect_links(persistence, link_urls=[f"{BASE}/A"], max_depth=1)
+    manager.collect_links(persistence, link_urls=[f"{BASE}/A"], max_depth=1)
+
+    assert len(persistence.catalog.upserts) == 2
+
+
+def test_scheduled_links_run_reads_the_catalog_once(http_router: OfflineRouter, tmp_path, monkeypatch):
+    http_router.add_routes({f"{BASE}/A": (200, _page(f"{BASE}/A1")), f"{BASE}/A1": (200, _page())})
+    manager = _make_manager(tmp_path, monkeypatch)
+    persistence = _make_persistence(tmp_path)
+    manager.collect_links(persistence, link_urls=[f"{BASE}/A"], max_depth=2)
+
+    catalog = persistence.catalog
+    catalog.get_metadata_by_filter = MagicMock(wraps=catalog.get_metadata_by_filter)
+    catalog.get_metadata_for_hash = MagicMock(wraps=catalog.get_metadata_for_hash)
+    manager.schedule_collect_links(persistence)
+
+    catalog.get_metadata_by_filter.assert_called_once()
+    catalog.get_metadata_for_hash.assert_not_called()
+    assert len(catalog.upserts) == 2
+
+
+def test_iter_in_background_yields_every_item_in_order():
+    assert list(manager_module._iter_in_background(range(200), maxsize=4)) == list(range(200))
+
+
+def test_iter_in_background_reraises_producer_errors():
+    def crawl():
+        yield 1
+        yield 2
+        raise RuntimeError("connection reset")
+
+    received = []
+    with pytest.raises(RuntimeError, match="connection reset"):
+        for item in manager_module._iter_in_background(crawl()):
+            received.append(item)
+    assert received == [1, 2]
+
+
+def test_iter_in_background_close_stops_and_joins_the_producer():
+    closed = threading.Event()
+
+    def crawl():
+        try:
+            yield from itertools.count()
+        finally:
+            closed.set()
+
+    items = manager_module._iter_in_background(crawl(), maxsize=2)
+    assert [next(items) for _ in range(3)] == [0, 1, 2]
+    items.close()
+
+    assert closed.is_set()
+    assert not any(thread.name == "crawl-producer" and thread.is_alive() for thread in threading.enumerate())
+
+
+def test_weblist_entries_are_routed_by_prefix(tmp_path, monkeypatch):
+    manager = _make_manager(tmp_path, monkeypatch)
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "weblists").mkdir()
+    (tmp_path / "weblists" / "sources.list").write_text(
+        "# seeds\n"
+        f"{BASE}/A,2\n"
+        "git-https://github.com/org/repo\n"
+        "sso-https://private.test/Page\n"
+        f"{BASE}/A\n"
+        "sso-https://private.test/Page\n"
+    )
+
+    link_urls, git_urls, sso_urls = manager._collect_urls_from_lists_by_type(["sources.list"])
+
+    assert link_urls == [f"{BASE}/A"]
+    assert git_urls == ["https://github.com/org/repo"]
+    assert sso_urls == ["https://private.test/Page"]
+
+
+@pytest.mark.parametrize("parallel", ["1", "2"])
+def test_max_pages_is_shared_by_all_seeds(http_router: OfflineRouter, tmp_path, monkeypatch, parallel):
+    monkeypatch.setenv("SCRAPER_RUNNER_PARALLEL", parallel)
+    http_router.add_routes({
+        f"{BASE}/A": (200, _page(f"{BASE}/A1", f"{BASE}/A2")),
+        f"{BASE}/A1": (200, _page()),
+        f"{BASE}/A2": (200, _page()),
+        f"{BASE}/B": (200, _page(f"{BASE}/B1", f"{BASE}/B2")),
+        f"{BASE}/B1": (200, _page()),
+        f"{BASE}/B2": (200, _page()),
+    })
+    manager = _make_manager(tmp_path, monkeypatch, max_pages=4)
+    persistence = _make_persistence(tmp_path)
+
+    count = manager.collect_links(persistence, link_urls=[f"{BASE}/A", f"{BASE}/B"], max_depth=2)
+
+    assert count == 4
+    assert len(persistence.catalog.metadata) == 4
+
+
+def test_max_pages_counts_pages_filtered_by_path_rules(http_router: OfflineRouter, tmp_path, monkeypatch):
+    http_router.add_routes({
+        f"{BASE}/A": (200, _page(f"{BASE}/A1", f"{BASE}/A2")),
+        f"{BASE}/A1": (200, _page()),
+        f"{BASE}/A2": (200, _page()),
+        f"{BASE}/B": (200, _page()),
+    })
+    manager = _make_manager(tmp_path, monkeypatch, max_pages=3, denied_path_regexes=["/Site/A1$"])
+    persistence = _make_persistence(tmp_path)
+
+    count = manager.collect_links(persistence, link_urls=[f"{BASE}/A", f"{BASE}/B"], max_depth=2)
+
+    # A, A1 and A2 are fetched; A1 is not kept but still uses up the budget, so B is never crawled
+    assert count == 2
+    assert {meta["url"] for meta in persistence.catalog.metadata.values()} == {f"{BASE}/A", f"{BASE}/A2"}
+
+
+def test_scheduled_run_records_new_validators_for_unchanged_pages(http_router: OfflineRouter, tmp_path, monkeypatch):
+    http_router.mocker.get(f"{BASE}/A", text=_page(), headers={"Content-Type": "text/html", "ETag": '"v1"'})
+    manager = _make_manager(tmp_path, monkeypatch, incremental_sync_enabled=True)
+    persistence = _make_persistence(tmp_path)
+    manager.collect_links(persistence, link_urls=[f"{BASE}/A"], max_depth=1)
+
+    # same body, new ETag: the page is not rewritten but the catalog has to learn the new validator
+    http_router.mocker.get(f"{BASE}/A", text=_page(), headers={"Content-Type": "text/html", "ETag": '"v2"'})
+    manager.schedule_collect_links(persistence)
+
+    assert http_router.mocker.last_request.headers["If-None-Match"] == '"v1"'
+    assert len(persistence.catalog.upserts) == 2
+    assert next(iter(persistence.catalog.metadata.values()))["etag"] == '"v2"'
+
+    manager.schedule_collect_links(persistence)
+    assert http_router.mocker.last_request.headers["If-None-Match"] == '"v2"'
+    assert len(persistence.catalog.upserts) == 2
+
+
+def test_collect_links_restores_deleted_files_of_unchanged_pages(http_router: OfflineRouter, tmp_path, monkeypatch):
+    http_router.add_routes({f"{BASE}/A": (200, _page())})
+    manager = _make_manager(tmp_path, monkeypatch)
+    persistence = _make_persistence(tmp_path)
+    manager.collect_links(persistence, link_urls=[f"{BASE}/A"], max_depth=1)
+    stored_file = _stored_file(persistence, f"{BASE}/A")
+    stored_file.unlink()
+
+    manager.schedule_collect_links(persistence)
+
+    assert stored_file.read_text() == _page()
+    assert len(persistence.catalog.upserts) == 2
+
+
+def test_failed_batch_is_logged_as_a_persistence_error_and_not_retried(http_router: OfflineRouter, tmp_path, monkeypatch):
+    http_router.add_routes({f"{BASE}/A": (200, _page(f"{BASE}/A1")), f"{BASE}/A1": (200, _page())})
+    monkeypatch.setattr(manager_module, "PERSIST_BATCH_SIZE", 1)
+    logger = MagicMock()
+    monkeypatch.setattr(manager_module, "logger", logger)
+    manager = _make_manager(tmp_path, monkeypatch)
+    persistence = _make_persistence(tmp_path)
+    persistence.persist_resources_batch = MagicMock(side_effect=RuntimeError("catalog unavailable"))
+
+    manager.collect_links(persistence, link_urls=[f"{BASE}/A"], max_depth=2)
+
+    persistence.persist_resources_batch.assert_called_once()
+    errors = [call.args[0] for call in logger.error.call_args_list]
+    assert len(errors) == 1
+    assert errors[0].startswith("Failed to persist 1 resources scraped from")
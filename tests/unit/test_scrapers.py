@@ -1,5 +1,7 @@
+import re
 import time
 import pytest
+from src.data_manager.collectors.scrapers import scraper as scraper_module
 from src.data_manager.collectors.scrapers.scraper import LinkScraper
 from tests.http.offline_router import OfflineRouter
 
@@ -71,4 +73,163 @@ def test_link_scraper_allowed_prefixes_and_sanitization(http_router: OfflineRout
         "https://twiki.test/CMSPublic/WorkBookGetAccount",
     ]
     assert len(scraped_links) == len(EXPECTED_LINKS)
-    assert set(scraped_links) == set(EXPECTED_LINKS)
\ No newline at end of file
+    assert set(scraped_links) == set(EXPECTED_LINKS)
+
+@pytest.mark.routesets("twiki", "deep_wiki")
+def test_link_scraper_accepts_precompiled_patterns(http_router: OfflineRouter):
+    scraper = LinkScraper(
+        allowed_path_regexes=[re.compile(".*crab3.*", re.IGNORECASE), ".*SWGuideCrab"],
+        denied_path_regexes=[re.compile("leftbar", re.IGNORECASE)],
+        delay=0
+    )
+
+    scraped_links = {resource.url for resource in scraper.crawl_iter(
+        "https://twiki.test/CMSPublic/SWGuide",
+        max_pages=100,
+        browserclient=None,
+        max_depth=10,
+        selenium_scrape=False
+    )}
+    assert "https://twiki.test/CMSPublic/SWGuideCrab" in scraped_links
+    assert "https://twiki.test/CMSPublic/CRAB3FAQ" in scraped_links
+    assert not any("LeftBar" in link for link in scraped_links)
+
+@pytest.mark.routesets("twiki")
+def test_link_scraper_skips_non_html_responses(http_router: OfflineRouter):
+    base = "https://twiki.test/CMSPublic"
+    http_router.mocker.get(
+        f"{base}/SWGuide",
+        text=f'<a href="{base}/Release.tar.gz">tarball</a><a href="{base}/SWGuideMuons">muons</a>',
+        headers={"Content-Type": "text/html"},
+    )
+    http_router.mocker.get(
+        f"{base}/Release.tar.gz",
+        content=b"\x1f\x8b" * 1024,
+        headers={"Content-Type": "application/gzip"},
+    )
+    scraper = LinkScraper(delay=0)
+
+    scraped_links = [resource.url for resource in scraper.crawl_iter(
+        f"{base}/SWGuide",
+        browserclient=None,
+        max_depth=2,
+        selenium_scrape=False
+    )]
+    assert set(scraped_links) == {f"{base}/SWGuide", f"{base}/SWGuideMuons"}
+
+@pytest.mark.routesets("twiki")
+def test_link_scraper_skips_pages_not_modified(http_router: OfflineRouter):
+    base = "https://twiki.test/CMSPublic"
+    http_router.mocker.get(
+        f"{base}/SWGuide",
+        text=f'<a href="{base}/SWGuideMuons">muons</a>',
+        headers={"Content-Type": "text/html", "ETag": '"v1"'},
+    )
+    http_router.mocker.get(
+        f"{base}/SWGuide",
+        request_headers={"If-None-Match": '"v1"'},
+        status_code=304,
+    )
+    scraper = LinkScraper(delay=0)
+
+    first = list(scraper.crawl_iter(f"{base}/SWGuide", max_depth=2))
+    validators = {resource.url: {"etag": resource.metadata["etag"]} for resource in first if "etag" in resource.metadata}
+    assert validators == {f"{base}/SWGuide": {"etag": '"v1"'}}
+
+    second = list(scraper.crawl_iter(f"{base}/SWGuide", max_depth=2, validators=validators))
+    assert second == []
+
+class _CookieClient:
+    def authenticate(self, url):
+        return [{"name": "sso_token", "value": "secret", "domain": "twiki.test"}]
+
+@pytest.mark.routesets("twiki")
+def test_link_scraper_keeps_sso_cookies_off_the_shared_session(http_router: OfflineRouter):
+    base = "https://twiki.test/CMSPublic"
+    http_router.mocker.get(f"{base}/SWGuide", text="<p>private</p>", headers={"Content-Type": "text/html"})
+    scraper = LinkScraper(delay=0)
+
+    authenticated = list(scraper.crawl_iter(f"{base}/SWGuide", browserclient=_CookieClient(), max_depth=1))
+    assert [resource.url for resource in authenticated] == [f"{base}/SWGuide"]
+    assert "sso_token=secret" in http_router.mocker.last_request.headers.get("Cookie", "")
+
+    list(scraper.crawl_iter(f"{base}/SWGuide", max_depth=1))
+    assert "Cookie" not in http_router.mocker.last_request.headers
+    assert len(scraper.session.cookies) == 0
+
+@pytest.mark.routesets("twiki")
+def test_link_scraper_crawls_with_lxml_fallback(http_router: OfflineRouter, monkeypatch):
+    pytest.importorskip("lxml")
+    monkeypatch.setattr(scraper_module, "LexborHTMLParser", None)
+    scraper = LinkScraper(delay=0)
+    scraped = scraper.crawl_iter(
+        "https://twiki.test/CMSPublic/SWGuide",
+        browserclient=None,
+        max_depth=2,
+        selenium_scrape=False
+    )
+    assert len(list(scraped)) == 6
+
+def test_lxml_fallback_extracts_nested_and_sibling_anchors():
+    pytest.importorskip("lxml")
+    page = '<html><body><div><a href="/a">a</a><p><a href="/b">b</a></p></div><a>no href</a><a href="/c">c</a></body></html>'
+    assert list(scraper_module._iter_hrefs_lxml(page)) == ["/a", "/b", "/c"]
+    assert list(scraper_module._iter_hrefs_lxml(page.encode())) == ["/a", "/b", "/c"]
+    assert list(scraper_module._iter_hrefs_lxml("plain text")) == []
+
+def test_link_scraper_keeps_backreferences_working():
+    # the first pattern shifts group numbers in a combined alternation, so \1 must be matched on its own
+    scraper = LinkScraper(allowed_path_regexes=["/(Crab)/", r"/(\w+)/\1$"], denied_path_regexes=[r"/(diff)/\1"], delay=0)
+    assert scraper._is_allowed_path("/WorkBook/WorkBook")
+    assert not scraper._is_allowed_path("/WorkBook/SWGuide")
+    assert not scraper._is_allowed_path("/diff/diff/diff")
+
+@pytest.mark.routesets("twiki")
+def test_link_scraper_keeps_pdfs_served_as_octet_stream(http_router: OfflineRouter):
+    base = "https://twiki.test/CMSPublic"
+    http_router.mocker.get(
+        f"{base}/SWGuide",
+        text=f'<a href="{base}/Manual.pdf">manual</a>',
+        headers={"Content-Type": "text/html"},
+    )
+    http_router.mocker.get(
+        f"{base}/Manual.pdf",
+        content=b"%PDF-1.4 manual",
+        headers={"Content-Type": "application/octet-stream"},
+    )
+    scraper = LinkScraper(delay=0)
+
+    scraped = {resource.url: resource for resource in scraper.crawl_iter(f"{base}/SWGuide", max_depth=2)}
+    assert set(scraped) == {f"{base}/SWGuide", f"{base}/Manual.pdf"}
+    assert scraped[f"{base}/Manual.pdf"].suffix == "pdf"
+    assert scraped[f"{base}/Manual.pdf"].content == b"%PDF-1.4 manual"
+
+@pytest.mark.routesets("twiki")
+def test_link_scraper_drops_oversized_bodies_without_content_length(http_router: OfflineRouter, monkeypatch):
+    base = "https://twiki.test/CMSPublic"
+    monkeypatch.setattr(scraper_module, "MAX_RESPONSE_BYTES", 1024)
+    monkeypatch.setattr(scraper_module, "READ_CHUNK_BYTES", 256)
+    http_router.mocker.get(
+        f"{base}/SWGuide",
+        text=f'<a href="{base}/Huge">huge</a>',
+        headers={"Content-Type": "text/html"},
+    )
+    http_router.mocker.get(f"{base}/Huge", content=b"x" * 4096, headers={"Content-Type": "text/html"})
+    scraper = LinkScraper(delay=0)
+
+    scraped_links = [resource.url for resource in scraper.crawl_iter(f"{base}/SWGuide", max_depth=2)]
+    assert scraped_links == [f"{base}/SWGuide"]
+
+@pytest.mark.routesets("twiki")
+def test_link_scraper_decodes_pages_with_their_declared_charset(http_router: OfflineRouter):
+    base = "https://twiki.test/CMSPublic"
+    http_router.mocker.get(
+        f"{base}/Cafe",
+        content="<p>café</p>".encode("iso-8859-1"),
+        headers={"Content-Type": "text/html; charset=iso-8859-1"},
+    )
+    scraper = LinkScraper(delay=0)
+
+    (resource,) = scraper.crawl_iter(f"{base}/Cafe", max_depth=1)
+    assert resource.content == "<p>café</p>"
+    assert resource.metadata["encoding"] == "iso-8859-1"